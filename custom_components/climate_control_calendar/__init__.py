@@ -1,10 +1,11 @@
 """Climate Control Calendar integration for Home Assistant."""
+from functools import partial
 import logging
 from typing import Any
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import ConfigEntryNotReady
 
 from .const import (
@@ -23,6 +24,7 @@ from .const import (
     DATA_BINDING_MANAGER,  # New: binding manager
     DATA_CONFIG,
     DATA_UNSUB,
+    DATA_DEBUG_LOGGING,
     DEFAULT_UPDATE_INTERVAL,
     DEFAULT_DRY_RUN,
     DEFAULT_DEBUG_MODE,
@@ -41,6 +43,50 @@ _LOGGER = logging.getLogger(__name__)
 PLATFORMS: list[Platform] = []
 
 
+@callback
+def async_enable_debug_logging(hass: HomeAssistant, entry_id: str) -> None:
+    """
+    Turn on debug logging for the integration on behalf of an entry.
+
+    The integration logger is shared by all entries: the first debug entry
+    raises it to DEBUG and remembers the previous level.
+
+    Args:
+        hass: Home Assistant instance
+        entry_id: Config entry ID with debug mode on
+    """
+    debug_logging = hass.data.get(DATA_DEBUG_LOGGING)
+    if debug_logging is not None:
+        debug_logging[1].add(entry_id)
+        return
+
+    integration_logger = logging.getLogger(__package__)
+    hass.data[DATA_DEBUG_LOGGING] = (integration_logger.level, {entry_id})
+    integration_logger.setLevel(logging.DEBUG)
+
+
+@callback
+def async_disable_debug_logging(hass: HomeAssistant, entry_id: str) -> None:
+    """
+    Release an entry's hold on debug logging.
+
+    The previous logger level is restored once no debug entry is left.
+
+    Args:
+        hass: Home Assistant instance
+        entry_id: Config entry ID being unloaded
+    """
+    debug_logging = hass.data.get(DATA_DEBUG_LOGGING)
+    if debug_logging is None:
+        return
+
+    previous_level, entry_ids = debug_logging
+    entry_ids.discard(entry_id)
+    if not entry_ids:
+        del hass.data[DATA_DEBUG_LOGGING]
+        logging.getLogger(__package__).setLevel(previous_level)
+
+
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """
     Set up Climate Control Calendar from a config entry.
@@ -80,6 +126,13 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             "Please ensure the calendar integration is loaded."
         )
 
+    # Debug mode: verbose logging for the whole integration while loaded
+    if debug_mode:
+        async_enable_debug_logging(hass, entry.entry_id)
+        entry.async_on_unload(
+            partial(async_disable_debug_logging, hass, entry.entry_id)
+        )
+
     # Create event emitter
     event_emitter = EventEmitter(hass, entry.entry_id)
 
@@ -153,14 +206,13 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             climate_entities=climate_entities,
         )
 
-        if debug_mode:
-            _LOGGER.debug(
-                "Engine evaluation complete | Active slot: %s | Changed: %s | Forced: %s | Events: %d",
-                result.get("active_slot_id"),
-                result.get("changed"),
-                result.get("forced"),
-                result.get("active_events_count", 0),
-            )
+        _LOGGER.debug(
+            "Engine evaluation complete | Active slot: %s | Changed: %s | Forced: %s | Events: %d",
+            result.get("active_slot_id"),
+            result.get("changed"),
+            result.get("forced"),
+            result.get("active_events_count", 0),
+        )
 
     def _handle_coordinator_update() -> None:
         """Handle coordinator updates (sync wrapper for listener)."""
@@ -183,9 +235,8 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     if len(hass.data[DOMAIN]) == 1:
         await async_setup_services(hass)
         # Register frontend panel - only on first entry
-        _LOGGER.warning("🎨 About to register panel - this should show in logs!")
+        _LOGGER.debug("Registering frontend panel")
         await async_register_panel(hass)
-        _LOGGER.warning("🎨 Panel registration call completed")
 
     _LOGGER.info(
         "Climate Control Calendar setup complete. "
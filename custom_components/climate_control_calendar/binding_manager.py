@@ -16,7 +16,8 @@ from typing import Any
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import HomeAssistantError
 
-from .event_matcher import EventMatcher, matches_calendar
+from .const import DOMAIN, DATA_CONFIG_JSON
+from .event_matcher import CompiledBindingMatcher, EventMatcher, matches_calendar
 from .condition_validator import check_conditions
 
 _LOGGER = logging.getLogger(__name__)
@@ -53,6 +54,16 @@ class BindingManager:
         self._bindings: list[dict[str, Any]] = []
         self._calendar_configs = calendar_configs or {}
 
+        # Bindings bucketed by calendar ID, built lazily on first lookup
+        # Format: dict[calendar_id] = bindings matching that calendar (definition order)
+        self._bindings_by_calendar: dict[str, list[dict[str, Any]]] = {}
+        # Compiled event matchers for those buckets, built alongside them
+        self._matchers_by_calendar: dict[str, CompiledBindingMatcher] = {}
+
+        # Slot ID index into the available slots list, checked on every hit
+        # Format: dict[slot_id] = list position (first slot wins on duplicate IDs)
+        self._slot_index: dict[str, int] = {}
+
     async def async_load(self, bindings: list[dict[str, Any]] | None = None) -> None:
         """
         Load bindings from config entry options or provided list.
@@ -60,6 +71,8 @@ class BindingManager:
         Args:
             bindings: Optional bindings list (if None, loads from config entry)
         """
+        self._invalidate_binding_index()
+
         if bindings is not None:
             self._bindings = bindings
             _LOGGER.debug("Loaded %d bindings from provided list", len(self._bindings))
@@ -184,10 +197,7 @@ class BindingManager:
             calendar_id,
         )
 
-        calendar_bindings = [
-            b for b in self._bindings
-            if matches_calendar(b.get("calendars", []), calendar_id)
-        ]
+        calendar_bindings = self._get_calendar_bindings(calendar_id)
 
         _LOGGER.warning(
             "[BINDING DEBUG] Step 1 Result: Found %d bindings for calendar %s",
@@ -210,28 +220,14 @@ class BindingManager:
             len(calendar_bindings),
         )
 
-        matching_bindings = []
-        for binding in calendar_bindings:
-            match_config = binding.get("match", {})
+        matching_bindings = self._get_calendar_matcher(calendar_id).match_event(event)
+
+        for binding in matching_bindings:
             _LOGGER.warning(
-                "[BINDING DEBUG] Step 2: Testing binding %s with match %s against event '%s'",
+                "[BINDING DEBUG] ✅ MATCH! Binding %s matched event '%s'",
                 binding.get("id"),
-                match_config,
                 event.get("summary", "Unknown"),
             )
-            if EventMatcher.matches(match_config, event):
-                _LOGGER.warning(
-                    "[BINDING DEBUG] ✅ MATCH! Binding %s matched event '%s'",
-                    binding.get("id"),
-                    event.get("summary", "Unknown"),
-                )
-                matching_bindings.append(binding)
-            else:
-                _LOGGER.warning(
-                    "[BINDING DEBUG] ❌ NO MATCH: Binding %s did not match event '%s'",
-                    binding.get("id"),
-                    event.get("summary", "Unknown"),
-                )
 
         if not matching_bindings:
             _LOGGER.warning(
@@ -345,13 +341,57 @@ class BindingManager:
 
         return (slot, target_entities, resolved_priority, binding_metadata)
 
-    @staticmethod
+    def _get_calendar_bindings(self, calendar_id: str) -> list[dict[str, Any]]:
+        """
+        Get bindings that apply to a calendar, bucketed once per calendar.
+
+        Args:
+            calendar_id: Calendar entity ID
+
+        Returns:
+            Bindings matching the calendar, in definition order (do not mutate)
+        """
+        calendar_bindings = self._bindings_by_calendar.get(calendar_id)
+        if calendar_bindings is None:
+            calendar_bindings = [
+                b for b in self._bindings
+                if matches_calendar(b.get("calendars", []), calendar_id)
+            ]
+            self._bindings_by_calendar[calendar_id] = calendar_bindings
+        return calendar_bindings
+
+    def _get_calendar_matcher(self, calendar_id: str) -> CompiledBindingMatcher:
+        """
+        Get the compiled event matcher for a calendar's bindings.
+
+        Args:
+            calendar_id: Calendar entity ID
+
+        Returns:
+            Matcher over the calendar's bindings
+        """
+        matcher = self._matchers_by_calendar.get(calendar_id)
+        if matcher is None:
+            matcher = CompiledBindingMatcher(self._get_calendar_bindings(calendar_id))
+            self._matchers_by_calendar[calendar_id] = matcher
+        return matcher
+
+    def _invalidate_binding_index(self) -> None:
+        """Drop per-calendar binding buckets after bindings change."""
+        self._bindings_by_calendar.clear()
+        self._matchers_by_calendar.clear()
+
     def _find_slot_by_id(
+        self,
         slots: list[dict[str, Any]],
         slot_id: str,
     ) -> dict[str, Any] | None:
         """
-        Find slot by ID.
+        Find slot by ID using a position index.
+
+        A hit is confirmed against the slot ID at that position in the list
+        passed in; a miss or a mismatch (slots replaced or edited) rebuilds
+        the index from the slot IDs before answering.
 
         Args:
             slots: List of slot configurations
@@ -360,10 +400,21 @@ class BindingManager:
         Returns:
             Slot dict or None if not found
         """
-        for slot in slots:
-            if slot.get("id") == slot_id:
-                return slot
-        return None
+        position = self._slot_index.get(slot_id)
+        if (
+            position is not None
+            and position < len(slots)
+            and slots[position].get("id") == slot_id
+        ):
+            return slots[position]
+
+        # Build in reverse so the first slot with a given ID wins
+        self._slot_index = {
+            slot.get("id"): position
+            for position, slot in reversed(list(enumerate(slots)))
+        }
+        position = self._slot_index.get(slot_id)
+        return slots[position] if position is not None else None
 
     async def async_add_binding(
         self,
@@ -485,22 +536,30 @@ class BindingManager:
             _LOGGER.warning("Binding not found: %s", binding_id)
             return False
 
-        # Update fields
-        if calendars is not None:
-            binding["calendars"] = calendars
-
         if match_config is not None:
             # Validate match config
             valid, error = EventMatcher.validate_match_config(match_config)
             if not valid:
                 raise HomeAssistantError(f"Invalid match configuration: {error}")
-            binding["match"] = match_config
 
-        if slot_id is not None:
-            binding["slot_id"] = slot_id
+        # Collect fields that actually change
+        updates = {
+            key: value
+            for key, value in (
+                ("calendars", calendars),
+                ("match", match_config),
+                ("slot_id", slot_id),
+                ("priority", priority),
+            )
+            if value is not None and binding.get(key) != value
+        }
+
+        if not updates:
+            # Idempotent update: skip the config entry write and reload
+            _LOGGER.debug("Binding unchanged, not persisting: %s", binding_id)
+            return True
 
-        if priority is not None:
-            binding["priority"] = priority
+        binding.update(updates)
 
         # Persist to config entry
         await self._persist_bindings()
@@ -515,6 +574,9 @@ class BindingManager:
         Raises:
             HomeAssistantError: If config entry not found
         """
+        # Every mutation goes through here, so refresh the calendar buckets
+        self._invalidate_binding_index()
+
         entry = self.hass.config_entries.async_get_entry(self.entry_id)
         if not entry:
             raise HomeAssistantError(f"Config entry not found: {self.entry_id}")
@@ -523,6 +585,10 @@ class BindingManager:
         new_options = {**entry.options, "bindings": self._bindings}
         self.hass.config_entries.async_update_entry(entry, options=new_options)
 
+        # Bindings are edited in place, so the options can compare equal and
+        # no reload follows: drop the serialized config API response here
+        self.hass.data.get(DOMAIN, {}).get(self.entry_id, {}).pop(DATA_CONFIG_JSON, None)
+
         _LOGGER.debug("Bindings persisted to config entry")
 
     @staticmethod
@@ -572,10 +638,7 @@ class BindingManager:
         Returns:
             List of matching bindings
         """
-        return [
-            b for b in self._bindings
-            if matches_calendar(b.get("calendars", []), calendar_id)
-        ]
+        return list(self._get_calendar_bindings(calendar_id))
 
     def get_bindings_for_slot(self, slot_id: str) -> list[dict[str, Any]]:
         """
@@ -90,6 +90,10 @@ DATA_APPLIER: Final = "applier"
 DATA_CONFIG: Final = "config"
 DATA_UNSUB: Final = "unsub"
 DATA_BINDING_MANAGER: Final = "binding_manager"  # New: Binding manager instance
+DATA_CONFIG_JSON: Final = "config_json"  # Serialized config API response, dropped on config changes
+# Top-level hass.data key (hass.data[DOMAIN] holds only entry data):
+# (logger level before debug mode, entry IDs with debug mode on)
+DATA_DEBUG_LOGGING: Final = f"{DOMAIN}_debug_logging"
 
 # Logging prefixes
 LOG_PREFIX_ENGINE: Final = "[Engine]"
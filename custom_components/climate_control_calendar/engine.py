@@ -5,16 +5,24 @@ This engine now resolves slots via event-to-slot bindings instead of time-based
 """
 from __future__ import annotations
 
+from collections.abc import Mapping
+import copy
+from dataclasses import dataclass
 import logging
+import sys
+from types import MappingProxyType
 from typing import Any, TYPE_CHECKING
 
 from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
 
 from .const import (
-    DOMAIN,
     SLOT_ID,
     SLOT_LABEL,
     SLOT_CLIMATE_PAYLOAD,
+    SLOT_DEFAULT_CLIMATE_PAYLOAD,
+    SLOT_ENTITY_OVERRIDES,
+    SLOT_EXCLUDED_ENTITIES,
     LOG_PREFIX_ENGINE,
     LOG_PREFIX_DRY_RUN,
 )
@@ -27,6 +35,56 @@ if TYPE_CHECKING:
 
 _LOGGER = logging.getLogger(__name__)
 
+# Shared read-only stand-in for missing payloads/overrides (never mutated)
+_EMPTY_PAYLOAD: Mapping[str, Any] = MappingProxyType({})
+
+
+@dataclass(slots=True)
+class NormalizedSlot:
+    """
+    Slot configuration preprocessed once for the evaluation hot path.
+
+    Built from the slot dict stored in config entry options, so per-tick
+    code reads attributes instead of repeating dict lookups and defaults.
+    """
+
+    id: str
+    label: str
+    default_payload: Mapping[str, Any]
+    entity_overrides: Mapping[str, dict[str, Any]]
+    excluded_entities: frozenset[str]
+
+    @classmethod
+    def from_config(cls, slot: dict[str, Any]) -> NormalizedSlot:
+        """
+        Normalize a slot configuration dict.
+
+        Args:
+            slot: Slot configuration
+
+        Returns:
+            Normalized slot
+        """
+        slot_id = slot.get(SLOT_ID)
+        if isinstance(slot_id, str):
+            # Interned so the per-entity (slot_id, binding_id) comparison
+            # against the previous cycle is a pointer check even after the
+            # slot cache is rebuilt from a reloaded config
+            slot_id = sys.intern(slot_id)
+
+        return cls(
+            id=slot_id,
+            label=slot.get(SLOT_LABEL, "Unknown"),
+            # Support both new and legacy payload key names
+            default_payload=(
+                slot.get(SLOT_DEFAULT_CLIMATE_PAYLOAD)
+                or slot.get(SLOT_CLIMATE_PAYLOAD)
+                or _EMPTY_PAYLOAD
+            ),
+            entity_overrides=slot.get(SLOT_ENTITY_OVERRIDES) or _EMPTY_PAYLOAD,
+            excluded_entities=frozenset(slot.get(SLOT_EXCLUDED_ENTITIES, ())),
+        )
+
 
 class ClimateControlEngine:
     """
@@ -77,6 +135,10 @@ class ClimateControlEngine:
         # Format: dict[entity_id] = rendered_payload_dict
         self._previous_applied_payloads: dict[str, dict[str, Any]] = {}
 
+        # Per-slot derived data, computed once per slot instead of every tick
+        # Format: dict[slot_id] = (private copy of slot config, NormalizedSlot)
+        self._slot_cache: dict[str, tuple[dict[str, Any], NormalizedSlot]] = {}
+
         _LOGGER.info(
             "%s Engine initialized | Dry Run: %s | Debug: %s | Bindings: %s | Applier: %s",
             LOG_PREFIX_ENGINE,
@@ -111,19 +173,17 @@ class ClimateControlEngine:
             return []
 
         if not active_events:
-            if self.debug_mode:
-                _LOGGER.debug(
-                    "%s No active events, no slots to resolve",
-                    LOG_PREFIX_ENGINE,
-                )
-            return []
-
-        if self.debug_mode:
             _LOGGER.debug(
-                "%s Resolving slots for %d active events",
+                "%s No active events, no slots to resolve",
                 LOG_PREFIX_ENGINE,
-                len(active_events),
             )
+            return []
+
+        _LOGGER.debug(
+            "%s Resolving slots for %d active events",
+            LOG_PREFIX_ENGINE,
+            len(active_events),
+        )
 
         resolved_bindings = []
 
@@ -131,13 +191,12 @@ class ClimateControlEngine:
             calendar_id = event.get("calendar_id")
             event_summary = event.get("summary", "Unknown")
 
-            if self.debug_mode:
-                _LOGGER.debug(
-                    "%s Processing event: '%s' from %s",
-                    LOG_PREFIX_ENGINE,
-                    event_summary,
-                    calendar_id,
-                )
+            _LOGGER.debug(
+                "%s Processing event: '%s' from %s",
+                LOG_PREFIX_ENGINE,
+                event_summary,
+                calendar_id,
+            )
 
             # Resolve slot for this event via binding manager (returns 4-tuple or None)
             result = await self.binding_manager.resolve_slot_for_event(
@@ -162,36 +221,15 @@ class ClimateControlEngine:
 
                 # Note: emit_binding_matched moved to _apply_multiple_slots to fire only on changes
             else:
-                if self.debug_mode:
-                    _LOGGER.debug(
-                        "%s No binding found for event '%s' from %s",
-                        LOG_PREFIX_ENGINE,
-                        event_summary,
-                        calendar_id,
-                    )
+                _LOGGER.debug(
+                    "%s No binding found for event '%s' from %s",
+                    LOG_PREFIX_ENGINE,
+                    event_summary,
+                    calendar_id,
+                )
 
         return resolved_bindings
 
-    def _find_slot_by_id(
-        self,
-        slots: list[dict[str, Any]],
-        slot_id: str,
-    ) -> dict[str, Any] | None:
-        """
-        Find slot by ID.
-
-        Args:
-            slots: List of slot configurations
-            slot_id: Slot ID to find
-
-        Returns:
-            Slot dict or None if not found
-        """
-        for slot in slots:
-            if slot.get(SLOT_ID) == slot_id:
-                return slot
-        return None
-
     async def evaluate(
         self,
         active_events: list[dict[str, Any]],
@@ -213,25 +251,32 @@ class ClimateControlEngine:
         Returns:
             Evaluation result with active slot info
         """
-        if self.debug_mode:
-            _LOGGER.debug(
-                "%s === Engine Evaluation Start ===",
-                LOG_PREFIX_ENGINE,
-            )
-            _LOGGER.debug(
-                "%s Active events: %d | Slots: %d | Climate entities: %d",
-                LOG_PREFIX_ENGINE,
-                len(active_events),
-                len(slots),
-                len(climate_entities),
-            )
+        # Events the engine fires during one evaluation share a single
+        # timestamp; applier events keep their own (actual apply time)
+        cycle_timestamp = dt_util.utcnow().isoformat()
 
-        # Slot resolution via bindings (Decision D032: Event-driven architecture)
-        resolved_bindings = await self.resolve_slots_for_active_events(
-            active_events=active_events,
-            available_slots=slots,
+        _LOGGER.debug(
+            "%s === Engine Evaluation Start ===",
+            LOG_PREFIX_ENGINE,
+        )
+        _LOGGER.debug(
+            "%s Active events: %d | Slots: %d | Climate entities: %d",
+            LOG_PREFIX_ENGINE,
+            len(active_events),
+            len(slots),
+            len(climate_entities),
         )
 
+        # Slot resolution via bindings (Decision D032: Event-driven architecture)
+        # Most ticks have no active event: skip the resolution coroutine entirely
+        if active_events:
+            resolved_bindings = await self.resolve_slots_for_active_events(
+                active_events=active_events,
+                available_slots=slots,
+            )
+        else:
+            resolved_bindings = []
+
         # Apply ALL resolved bindings, not just first!
         # Bindings already sorted by priority in binding_manager
         entities_applied_count = 0
@@ -239,16 +284,16 @@ class ClimateControlEngine:
             entities_applied_count = await self._apply_multiple_slots(
                 resolved_bindings=resolved_bindings,
                 climate_entities_pool=climate_entities,
+                cycle_timestamp=cycle_timestamp,
             )
 
         # Note: Slot activation/deactivation tracking removed in new architecture
         # Multiple slots can be active simultaneously, tracked at entity level
 
-        if self.debug_mode:
-            _LOGGER.debug(
-                "%s === Engine Evaluation End ===",
-                LOG_PREFIX_ENGINE,
-            )
+        _LOGGER.debug(
+            "%s === Engine Evaluation End ===",
+            LOG_PREFIX_ENGINE,
+        )
 
         # Emit evaluation complete event with summary
         self.event_emitter.emit_evaluation_complete(
@@ -258,6 +303,7 @@ class ClimateControlEngine:
             forced_slot_id=None,  # Decision D035: No more forced slots
             dry_run=self.dry_run,
             debug_mode=self.debug_mode,
+            timestamp=cycle_timestamp,
         )
 
         # New architecture: Multiple slots may be active, no single "active_slot_id"
@@ -276,6 +322,7 @@ class ClimateControlEngine:
         self,
         resolved_bindings: list[tuple[dict[str, Any], list[str] | None, int, dict[str, str], str]],
         climate_entities_pool: list[str],
+        cycle_timestamp: str | None = None,
     ) -> int:
         """
         Apply multiple slots with priority-based conflict resolution.
@@ -287,10 +334,18 @@ class ClimateControlEngine:
         Args:
             resolved_bindings: List of (slot, target_entities, priority, binding_metadata, event_summary) tuples
             climate_entities_pool: Global climate entities pool (fallback)
+            cycle_timestamp: Event timestamp of the evaluation cycle
 
         Returns:
             Number of entities that had payloads applied
         """
+        # Hot-loop attribute lookups hoisted into locals
+        hass = self.hass
+        event_emitter = self.event_emitter
+        get_normalized_slot = self._get_normalized_slot
+        previous_state = self._previous_applied_state
+        previous_payloads = self._previous_applied_payloads
+
         # Sort by priority DESC (higher priority wins conflicts)
         sorted_bindings = sorted(
             resolved_bindings,
@@ -299,7 +354,7 @@ class ClimateControlEngine:
         )
 
         # Build current state: which binding should be applied to which entity
-        current_state: dict[str, tuple[str, str, dict[str, Any], list[str], str, dict[str, str]]] = {}
+        current_state: dict[str, tuple[str, str, NormalizedSlot, list[str], str, dict[str, str]]] = {}
         # Format: entity_id → (slot_id, binding_id, slot, target_entities, event_summary, binding_metadata)
 
         _LOGGER.info(
@@ -309,8 +364,9 @@ class ClimateControlEngine:
         )
 
         # Determine current state for each entity
-        for slot, target_entities, priority, binding_metadata, event_summary in sorted_bindings:
-            slot_id = slot.get("id")
+        for slot_config, target_entities, priority, binding_metadata, event_summary in sorted_bindings:
+            slot = get_normalized_slot(slot_config)
+            slot_id = slot.id
             binding_id = binding_metadata.get("binding_id", "unknown")
 
             # Determine entities to apply to
@@ -321,7 +377,7 @@ class ClimateControlEngine:
                 entities_for_this_binding = target_entities
 
             # Apply entity_overrides and excluded_entities from slot
-            excluded = set(slot.get("excluded_entities", []))
+            excluded = slot.excluded_entities
             entities_to_apply = [e for e in entities_for_this_binding if e not in excluded]
 
             # Filter out entities already assigned by higher priority
@@ -332,26 +388,26 @@ class ClimateControlEngine:
                 current_state[entity_id] = (slot_id, binding_id, slot, target_entities, event_summary, binding_metadata)
 
         # Now compare current_state with _previous_applied_state and apply only changes
-        entities_to_apply_changes: list[tuple[str, str, dict[str, Any], dict[str, Any], str, dict[str, str]]] = []
+        entities_to_apply_changes: list[tuple[str, str, NormalizedSlot, dict[str, Any], str, dict[str, str]]] = []
 
         # Check for new/changed bindings or changed payloads
         for entity_id, (slot_id, binding_id, slot, target_entities, event_summary, binding_metadata) in current_state.items():
-            prev_state = self._previous_applied_state.get(entity_id)
+            prev_state = previous_state.get(entity_id)
 
             # Build current payload for this entity (with entity_overrides if applicable)
-            default_payload = slot.get("default_climate_payload", {})
-            entity_overrides = slot.get("entity_overrides", {})
+            default_payload = slot.default_payload
+            entity_overrides = slot.entity_overrides
 
             # Merge default payload with entity-specific override
-            current_payload = default_payload.copy()
+            current_payload = dict(default_payload)
             if entity_id in entity_overrides:
                 current_payload.update(entity_overrides[entity_id])
 
             # Render templates in current payload
-            rendered_current_payload = render_climate_payload(self.hass, current_payload)
+            rendered_current_payload = render_climate_payload(hass, current_payload)
 
             # Get previous rendered payload
-            prev_rendered_payload = self._previous_applied_payloads.get(entity_id)
+            prev_rendered_payload = previous_payloads.get(entity_id)
 
             # Detect changes: binding changed OR payload changed
             binding_changed = prev_state is None or prev_state != (slot_id, binding_id)
@@ -376,10 +432,10 @@ class ClimateControlEngine:
                 )
 
                 # Update tracked payload
-                self._previous_applied_payloads[entity_id] = rendered_current_payload
+                previous_payloads[entity_id] = rendered_current_payload
 
         # Check for removed bindings (entities that had binding before but not anymore)
-        for entity_id, prev_state in self._previous_applied_state.items():
+        for entity_id, prev_state in previous_state.items():
             if entity_id not in current_state:
                 _LOGGER.info(
                     "%s [CHANGE DETECTED] Entity %s: binding removed (was: %s)",
@@ -388,15 +444,15 @@ class ClimateControlEngine:
                     prev_state,
                 )
                 # Clean up payload tracking for removed entity
-                if entity_id in self._previous_applied_payloads:
-                    del self._previous_applied_payloads[entity_id]
+                if entity_id in previous_payloads:
+                    del previous_payloads[entity_id]
 
                 # Note: We don't have a "clear" slot to apply here
                 # The entity will just keep its last applied state until next binding
                 # If you want to reset to default, you'd need to implement a default slot
 
         # Group entities by (slot_id, binding_id) to emit only one event per binding
-        entities_by_binding: dict[tuple[str, str], list[tuple[str, dict[str, Any], dict[str, Any], str]]] = {}
+        entities_by_binding: dict[tuple[str, str], list[tuple[str, NormalizedSlot, dict[str, Any], str]]] = {}
 
         for entity_id, slot_id, slot, binding_metadata, event_summary, metadata in entities_to_apply_changes:
             binding_id = binding_metadata["binding_id"]
@@ -414,26 +470,28 @@ class ClimateControlEngine:
             first_entity_id, first_slot, first_binding_metadata, first_event_summary = entities_data[0]
             entity_ids = [entity_id for entity_id, _, _, _ in entities_data]
 
-            entity_overrides = first_slot.get("entity_overrides", {})
+            entity_overrides = first_slot.entity_overrides
 
             # Apply to all entities in this binding at once
             await self._apply_slot_to_entities(
                 slot=first_slot,
                 entities=entity_ids,
                 entity_overrides=entity_overrides,
+                cycle_timestamp=cycle_timestamp,
             )
 
             # Emit binding matched event ONCE per binding (not per entity!)
-            self.event_emitter.emit_binding_matched(
+            event_emitter.emit_binding_matched(
                 binding_id=first_binding_metadata["binding_id"],
                 event_summary=first_event_summary,
                 calendar_id="",  # Not available here, could pass through if needed
                 slot_id=slot_id,
-                slot_label=first_slot.get("label", "Unknown"),
+                slot_label=first_slot.label,
                 match_type=first_binding_metadata["match_type"],
                 match_value=first_binding_metadata["match_value"],
                 priority=0,  # Not available here, could pass through if needed
                 target_entities=entity_ids,
+                timestamp=cycle_timestamp,
             )
 
             applied_count += len(entity_ids)
@@ -461,25 +519,50 @@ class ClimateControlEngine:
 
         return applied_count
 
+    def _get_normalized_slot(self, slot: dict[str, Any]) -> NormalizedSlot:
+        """
+        Get the normalized form of a slot, memoized per slot ID.
+
+        The cached entry is reused only while the slot config still equals
+        the private copy it was built from, so edits made in place or a
+        replaced slot with the same ID are picked up.
+
+        Args:
+            slot: Slot configuration
+
+        Returns:
+            Normalized slot
+        """
+        slot_key = slot.get(SLOT_ID)
+        cached = self._slot_cache.get(slot_key)
+        if cached is not None and cached[0] == slot:
+            return cached[1]
+
+        # Normalize the copy, so later edits to the live dict can't leak in
+        snapshot = copy.deepcopy(slot)
+        normalized = NormalizedSlot.from_config(snapshot)
+        self._slot_cache[slot_key] = (snapshot, normalized)
+        return normalized
+
     async def _apply_slot_to_entities(
         self,
-        slot: dict[str, Any],
+        slot: NormalizedSlot,
         entities: list[str],
-        entity_overrides: dict[str, dict[str, Any]],
+        entity_overrides: Mapping[str, dict[str, Any]],
+        cycle_timestamp: str | None = None,
     ) -> None:
         """
         Apply a slot to specific entities, respecting entity_overrides.
 
         Args:
-            slot: Slot configuration
+            slot: Normalized slot
             entities: Entities to apply to
             entity_overrides: Entity-specific payload overrides
+            cycle_timestamp: Event timestamp of the evaluation cycle
         """
-        slot_id = slot.get("id")
-        slot_label = slot.get("label")
-
-        # Get default payload (support both old and new key names)
-        default_payload = slot.get("default_climate_payload") or slot.get("climate_payload", {})
+        slot_id = slot.id
+        slot_label = slot.label
+        default_payload = slot.default_payload
 
         # Group entities by payload (default vs override)
         entities_by_payload: dict[str, list[str]] = {}
@@ -512,6 +595,7 @@ class ClimateControlEngine:
                 slot_label=slot_label,
                 payload=payload,
                 entities=entity_list,
+                cycle_timestamp=cycle_timestamp,
             )
 
     async def _apply_payload_to_entities(
@@ -520,6 +604,7 @@ class ClimateControlEngine:
         slot_label: str,
         payload: dict[str, Any],
         entities: list[str],
+        cycle_timestamp: str | None = None,
     ) -> None:
         """
         Apply a climate payload to a list of entities.
@@ -529,6 +614,7 @@ class ClimateControlEngine:
             slot_label: Slot label (for logging/events)
             payload: Climate payload to apply
             entities: Entities to apply to
+            cycle_timestamp: Event timestamp of the evaluation cycle
         """
         # Apply payload or dry run (Decision D035: No flag checks)
         if self.dry_run:
@@ -537,6 +623,7 @@ class ClimateControlEngine:
                 slot_label=slot_label,
                 climate_payload=payload,
                 climate_entities=entities,
+                cycle_timestamp=cycle_timestamp,
             )
         else:
             if self.applier:
@@ -556,100 +643,9 @@ class ClimateControlEngine:
                     slot_label=slot_label,
                     climate_payload=payload,
                     climate_entities=entities,
+                    cycle_timestamp=cycle_timestamp,
                 )
 
-    async def _handle_slot_activation(
-        self,
-        slot: dict[str, Any],
-        climate_entities: list[str],
-    ) -> None:
-        """
-        Handle slot activation (emit events, apply payload).
-
-        Decision D034: Slots no longer contain time_start/time_end.
-
-        Args:
-            slot: Activated slot configuration
-            climate_entities: List of climate entities
-        """
-        slot_id = slot[SLOT_ID]
-        slot_label = slot[SLOT_LABEL]
-        climate_payload = slot.get(SLOT_CLIMATE_PAYLOAD, {})
-
-        # Emit slot activation event (handles deduplication)
-        # Note: time_start/time_end removed (Decision D034)
-        self.event_emitter.emit_slot_activated(
-            slot_id=slot_id,
-            slot_label=slot_label,
-            time_start="N/A",  # No longer in slot definition
-            time_end="N/A",    # No longer in slot definition
-            climate_payload=climate_payload,
-        )
-
-        # Check if application should be skipped (D019)
-        if self.flag_manager and self.flag_manager.should_skip_application():
-            flag_type = self.flag_manager.get_active_flag_type()
-            _LOGGER.info(
-                "%s Skipping climate application due to flag: %s",
-                LOG_PREFIX_ENGINE,
-                flag_type,
-            )
-
-            # Emit skip events for each entity
-            for entity_id in climate_entities:
-                self.event_emitter.emit_climate_skipped(
-                    climate_entity_id=entity_id,
-                    slot_id=slot_id,
-                    slot_label=slot_label,
-                    reason=f"override_flag_{flag_type}",
-                )
-            return
-
-        # Apply payload or dry run
-        if self.dry_run:
-            # Dry run mode
-            self._execute_dry_run(
-                slot_id=slot_id,
-                slot_label=slot_label,
-                climate_payload=climate_payload,
-                climate_entities=climate_entities,
-            )
-        else:
-            # Real application (M3)
-            if self.applier:
-                await self._execute_application(
-                    slot_id=slot_id,
-                    slot_label=slot_label,
-                    climate_payload=climate_payload,
-                    climate_entities=climate_entities,
-                )
-            else:
-                _LOGGER.warning(
-                    "%s Applier not available, falling back to dry run logging",
-                    LOG_PREFIX_ENGINE,
-                )
-                self._execute_dry_run(
-                    slot_id=slot_id,
-                    slot_label=slot_label,
-                    climate_payload=climate_payload,
-                    climate_entities=climate_entities,
-                )
-
-    def _handle_slot_deactivation(self, previous_slot_id: str) -> None:
-        """
-        Handle slot deactivation.
-
-        Args:
-            previous_slot_id: Previously active slot ID
-        """
-        # Note: We don't have slot label here, just ID
-        # In real scenario, would look up from config
-        self.event_emitter.emit_slot_deactivated(
-            slot_id=previous_slot_id,
-            slot_label=f"Slot {previous_slot_id}",
-            reason="time_window_ended",
-        )
-
     async def _execute_application(
         self,
         slot_id: str,
@@ -708,6 +704,7 @@ class ClimateControlEngine:
         slot_label: str,
         climate_payload: dict[str, Any],
         climate_entities: list[str],
+        cycle_timestamp: str | None = None,
     ) -> None:
         """
         Execute dry run simulation (log what would happen).
@@ -717,12 +714,8 @@ class ClimateControlEngine:
             slot_label: Source slot label
             climate_payload: Climate settings
             climate_entities: Target climate entities
+            cycle_timestamp: Event timestamp of the evaluation cycle
         """
-        _LOGGER.warning(
-            "%s === DRY RUN MODE ACTIVE ===",
-            LOG_PREFIX_DRY_RUN,
-        )
-
         if not climate_entities:
             _LOGGER.warning(
                 "%s No climate entities configured, nothing to apply",
@@ -737,37 +730,32 @@ class ClimateControlEngine:
             )
             return
 
+        # Emit one dry run event for all entities
+        self.event_emitter.emit_dry_run_executed_batch(
+            slot_id=slot_id,
+            slot_label=slot_label,
+            climate_entity_ids=climate_entities,
+            payload=climate_payload,
+            timestamp=cycle_timestamp,
+        )
+
+        # Single multi-line record: one logging dispatch per activation,
+        # kept together under concurrent writers
         _LOGGER.warning(
-            "%s Slot activated: %s (ID: %s)",
+            "%s === DRY RUN MODE ACTIVE ===\n"
+            "%s Slot activated: %s (ID: %s)\n"
+            "%s Climate payload: %s\n"
+            "%s Would apply to %d climate entities: %s\n"
+            "%s === END DRY RUN ===",
+            LOG_PREFIX_DRY_RUN,
             LOG_PREFIX_DRY_RUN,
             slot_label,
             slot_id,
-        )
-
-        _LOGGER.warning(
-            "%s Climate payload: %s",
             LOG_PREFIX_DRY_RUN,
             climate_payload,
-        )
-
-        for entity_id in climate_entities:
-            # Emit dry run event
-            self.event_emitter.emit_dry_run_executed(
-                slot_id=slot_id,
-                slot_label=slot_label,
-                climate_entity_id=entity_id,
-                payload=climate_payload,
-            )
-
-        _LOGGER.warning(
-            "%s Would apply to %d climate entities: %s",
             LOG_PREFIX_DRY_RUN,
             len(climate_entities),
             climate_entities,
-        )
-
-        _LOGGER.warning(
-            "%s === END DRY RUN ===",
             LOG_PREFIX_DRY_RUN,
         )
 
@@ -790,10 +778,13 @@ class ClimateControlEngine:
 
     def set_debug_mode(self, enabled: bool) -> None:
         """
-        Update debug mode at runtime.
+        Update the debug mode flag reported in evaluation events.
+
+        The debug logging level itself is applied per config entry at
+        setup; changing the option reloads the entry.
 
         Args:
-            enabled: Enable or disable debug logging
+            enabled: Debug mode status
         """
         old_value = self.debug_mode
         self.debug_mode = enabled
@@ -8,6 +8,8 @@ Decision D032: Event-to-Slot Binding System
 """
 from __future__ import annotations
 
+from collections.abc import Callable
+from functools import lru_cache
 import logging
 import re
 from typing import Any
@@ -15,6 +17,68 @@ from typing import Any
 _LOGGER = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=256)
+def _compile_regex(pattern: str) -> re.Pattern[str]:
+    """
+    Compile a binding regex pattern once and reuse it.
+
+    Binding patterns are a small, fixed set evaluated on every cycle, so
+    caching the compiled object skips the re module's own cache lookup
+    and flag handling on each match.
+
+    Args:
+        pattern: Regular expression pattern
+
+    Returns:
+        Compiled pattern
+
+    Raises:
+        re.error: If the pattern is invalid (failures are not cached)
+    """
+    return re.compile(pattern)
+
+
+# Characters that make a pattern more than a plain literal
+_REGEX_METACHARACTERS = frozenset(".^$*+?{}[]\\|()")
+
+
+@lru_cache(maxsize=256)
+def _compile_summary_regex(pattern: str) -> Callable[[str], bool]:
+    """
+    Build a predicate equivalent to re.match(pattern, summary).
+
+    Literal patterns, optionally anchored with "^" and/or "$", are answered
+    with plain string operations instead of the regex engine: re.match
+    already anchors at the start, so "Work" and "^Work" are a prefix test
+    and "Work$" is an equality test ("$" also matches before a trailing
+    newline). Anything else goes through the compiled pattern.
+
+    Args:
+        pattern: Regular expression pattern
+
+    Returns:
+        Predicate taking the event summary
+
+    Raises:
+        re.error: If the pattern is invalid
+    """
+    literal = pattern[1:] if pattern.startswith("^") else pattern
+    anchored_end = literal.endswith("$")
+    if anchored_end:
+        literal = literal[:-1]
+
+    if _REGEX_METACHARACTERS.isdisjoint(literal):
+        if anchored_end:
+            literal_newline = literal + "\n"
+            return lambda summary: summary == literal or summary == literal_newline
+        return lambda summary: summary.startswith(literal)
+
+    # Always match through the cached Pattern: compiled.match() skips
+    # re.match()'s re._compile cache lookup and flag checks per call
+    compiled = _compile_regex(pattern)
+    return lambda summary: compiled.match(summary) is not None
+
+
 class EventMatcher:
     """
     Matches calendar events against binding rules.
@@ -39,11 +103,11 @@ class EventMatcher:
     MATCH_TYPE_DESCRIPTION = "description"
     MATCH_TYPE_LOCATION = "location"
 
-    SUPPORTED_MATCH_TYPES = [
+    SUPPORTED_MATCH_TYPES = frozenset({
         MATCH_TYPE_SUMMARY,
         MATCH_TYPE_SUMMARY_CONTAINS,
         MATCH_TYPE_REGEX,
-    ]
+    })
 
     @classmethod
     def matches(
@@ -82,94 +146,66 @@ class EventMatcher:
             >>> EventMatcher.matches(match_config, event)
             True
         """
-        match_type = match_config.get("type")
-        match_value = match_config.get("value")
-
-        if not match_type or not match_value:
-            _LOGGER.warning(
-                "Invalid match config: missing type or value | config=%s",
-                match_config,
-            )
-            return False
-
-        if match_type not in cls.SUPPORTED_MATCH_TYPES:
-            _LOGGER.warning(
-                "Unsupported match type: %s | Supported: %s",
-                match_type,
-                cls.SUPPORTED_MATCH_TYPES,
-            )
+        predicate = cls.compile(match_config)
+        if predicate is None:
             return False
 
-        # Dispatch to specific match method
-        if match_type == cls.MATCH_TYPE_SUMMARY:
-            return cls._match_summary_exact(match_value, event)
-        elif match_type == cls.MATCH_TYPE_SUMMARY_CONTAINS:
-            return cls._match_summary_contains(match_value, event)
-        elif match_type == cls.MATCH_TYPE_REGEX:
-            return cls._match_regex(match_value, event)
-
-        return False
-
-    @staticmethod
-    def _match_summary_exact(pattern: str, event: dict[str, Any]) -> bool:
-        """
-        Exact match on event summary.
-
-        Case-sensitive exact string comparison.
-
-        Args:
-            pattern: Expected summary value
-            event: Calendar event
+        summary = event.get("summary", "")
+        return predicate(summary, summary.lower())
 
-        Returns:
-            True if summary matches exactly
-        """
-        event_summary = event.get("summary", "")
-        return event_summary == pattern
-
-    @staticmethod
-    def _match_summary_contains(substring: str, event: dict[str, Any]) -> bool:
+    @classmethod
+    def compile(cls, match_config: dict[str, Any]) -> Callable[[str, str], bool] | None:
         """
-        Substring match on event summary (fuzzy match).
+        Compile a match configuration into a summary predicate.
 
-        Case-insensitive substring search.
+        The predicate takes the event summary and its lowercased form, so a
+        caller testing one event against many bindings lowers it only once.
 
         Args:
-            substring: Substring to search for
-            event: Calendar event
+            match_config: Match configuration with type and value
 
         Returns:
-            True if summary contains the substring
+            Predicate (summary, summary_lower) -> bool, or None if the
+            configuration is invalid or unsupported
         """
-        event_summary = event.get("summary", "")
-        return substring.lower() in event_summary.lower()
-
-    @staticmethod
-    def _match_regex(pattern: str, event: dict[str, Any]) -> bool:
-        """
-        Regular expression match on event summary.
+        match_type = match_config.get("type")
+        match_value = match_config.get("value")
 
-        Uses Python re.match() which matches from the beginning of the string.
-        To match anywhere in the string, use pattern like ".*keyword.*"
+        if not match_type or not match_value:
+            _LOGGER.warning(
+                "Invalid match config: missing type or value | config=%s",
+                match_config,
+            )
+            return None
 
-        Args:
-            pattern: Regular expression pattern
-            event: Calendar event
+        if match_type == cls.MATCH_TYPE_SUMMARY:
+            return lambda summary, summary_lower: summary == match_value
 
-        Returns:
-            True if summary matches the regex pattern
-        """
-        event_summary = event.get("summary", "")
-
-        try:
-            return bool(re.match(pattern, event_summary))
-        except re.error as err:
-            _LOGGER.error(
-                "Invalid regex pattern: %s | Error: %s",
-                pattern,
-                err,
+        if match_type == cls.MATCH_TYPE_SUMMARY_CONTAINS:
+            needle = match_value.lower()
+            needle_len = len(needle)
+            return lambda summary, summary_lower: (
+                needle_len <= len(summary_lower) and needle in summary_lower
             )
-            return False
+
+        if match_type == cls.MATCH_TYPE_REGEX:
+            try:
+                regex_match = _compile_summary_regex(match_value)
+            except re.error as err:
+                _LOGGER.error(
+                    "Invalid regex pattern: %s | Error: %s",
+                    match_value,
+                    err,
+                )
+                return None
+            return lambda summary, summary_lower: regex_match(summary)
+
+        _LOGGER.warning(
+            "Unsupported match type: %s | Supported: %s",
+            match_type,
+            sorted(cls.SUPPORTED_MATCH_TYPES),
+        )
+        return None
 
     @classmethod
     def validate_match_config(cls, match_config: dict[str, Any]) -> tuple[bool, str | None]:
@@ -194,7 +230,7 @@ class EventMatcher:
 
         # Check match type is supported
         if match_type not in cls.SUPPORTED_MATCH_TYPES:
-            return False, f"Unsupported match type: {match_type}. Supported: {cls.SUPPORTED_MATCH_TYPES}"
+            return False, f"Unsupported match type: {match_type}. Supported: {sorted(cls.SUPPORTED_MATCH_TYPES)}"
 
         # Validate match value is not empty
         if not match_value or not str(match_value).strip():
@@ -204,13 +240,56 @@ class EventMatcher:
         if match_type == cls.MATCH_TYPE_REGEX:
             # Validate regex pattern
             try:
-                re.compile(match_value)
+                _compile_regex(match_value)
             except re.error as err:
                 return False, f"Invalid regex pattern: {err}"
 
         return True, None
 
 
+class CompiledBindingMatcher:
+    """
+    Matches events against a fixed set of bindings compiled up front.
+
+    Each binding's match config is parsed and dispatched once; matching an
+    event then reads and lowercases its summary once for all bindings.
+    """
+
+    __slots__ = ("_compiled",)
+
+    def __init__(self, bindings: list[dict[str, Any]]) -> None:
+        """
+        Compile bindings into predicates.
+
+        Args:
+            bindings: Bindings to match against, in definition order.
+                Bindings with invalid match configs never match.
+        """
+        self._compiled: list[tuple[dict[str, Any], Callable[[str, str], bool]]] = []
+        for binding in bindings:
+            predicate = EventMatcher.compile(binding.get("match", {}))
+            if predicate is not None:
+                self._compiled.append((binding, predicate))
+
+    def match_event(self, event: dict[str, Any]) -> list[dict[str, Any]]:
+        """
+        Get bindings whose match config matches an event.
+
+        Args:
+            event: Calendar event
+
+        Returns:
+            Matching bindings, in definition order
+        """
+        summary = event.get("summary", "")
+        summary_lower = summary.lower()
+        return [
+            binding
+            for binding, predicate in self._compiled
+            if predicate(summary, summary_lower)
+        ]
+
+
 def matches_calendar(
     calendar_filter: str | list[str],
     calendar_id: str,
@@ -243,13 +322,8 @@ def matches_calendar(
         >>> matches_calendar(["calendar.work"], "calendar.vacation")
         False
     """
-    # Wildcard matches all
-    if calendar_filter == "*":
-        return True
-
-    # Convert single string to list
+    # Single string: wildcard or one calendar ID, no container needed
     if isinstance(calendar_filter, str):
-        calendar_filter = [calendar_filter]
+        return calendar_filter == "*" or calendar_filter == calendar_id
 
-    # Check if calendar_id is in the list
     return calendar_id in calendar_filter
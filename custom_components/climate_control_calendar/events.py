@@ -22,6 +22,8 @@ _LOGGER = logging.getLogger(__name__)
 class EventEmitter:
     """Handles event emission for Climate Control Calendar."""
 
+    __slots__ = ("hass", "entry_id", "_last_active_slot_id")
+
     def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
         """
         Initialize event emitter.
@@ -34,28 +36,33 @@ class EventEmitter:
         self.entry_id = entry_id
         self._last_active_slot_id: str | None = None
 
-    def _emit_event(self, event_type: str, event_data: dict[str, Any]) -> None:
+    def _emit_event(
+        self,
+        event_type: str,
+        event_data: dict[str, Any],
+        timestamp: str | None = None,
+    ) -> None:
         """
         Emit Home Assistant event with base metadata.
 
         Args:
             event_type: Event type constant
-            event_data: Event-specific data
+            event_data: Event-specific data, freshly built by the caller
+                (base metadata is added to it in place)
+            timestamp: ISO timestamp to report (defaults to now)
         """
         # Add base metadata
-        full_event_data = {
-            "entry_id": self.entry_id,
-            "timestamp": dt_util.utcnow().isoformat(),
-            **event_data,
-        }
-
-        self.hass.bus.fire(event_type, full_event_data)
-
-        _LOGGER.debug(
-            "Event emitted: %s | Data: %s",
-            event_type,
-            full_event_data,
-        )
+        event_data["entry_id"] = self.entry_id
+        event_data["timestamp"] = timestamp or dt_util.utcnow().isoformat()
+
+        self.hass.bus.fire(event_type, event_data)
+
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "Event emitted: %s | Data: %s",
+                event_type,
+                event_data,
+            )
 
     def emit_calendar_changed(
         self,
@@ -199,11 +206,12 @@ class EventEmitter:
         )
 
         if success:
-            _LOGGER.info(
-                "Climate payload applied: %s → %s",
-                climate_entity_id,
-                payload,
-            )
+            if _LOGGER.isEnabledFor(logging.INFO):
+                _LOGGER.info(
+                    "Climate payload applied: %s → %s",
+                    climate_entity_id,
+                    payload,
+                )
         else:
             _LOGGER.error(
                 "Climate payload failed: %s → %s | Error: %s",
@@ -212,37 +220,33 @@ class EventEmitter:
                 error,
             )
 
-    def emit_dry_run_executed(
+    def emit_dry_run_executed_batch(
         self,
         slot_id: str,
         slot_label: str,
-        climate_entity_id: str,
+        climate_entity_ids: list[str],
         payload: dict[str, Any],
+        timestamp: str | None = None,
     ) -> None:
         """
-        Emit dry run execution event.
+        Emit a single dry run execution event covering several entities.
 
         Args:
             slot_id: Source slot ID
             slot_label: Source slot label
-            climate_entity_id: Target climate entity
+            climate_entity_ids: Target climate entities
             payload: Payload that would be applied
+            timestamp: Evaluation cycle timestamp (defaults to now)
         """
         self._emit_event(
             EVENT_DRY_RUN_EXECUTED,
             {
                 "slot_id": slot_id,
                 "slot_label": slot_label,
-                "climate_entity_id": climate_entity_id,
+                "climate_entities": climate_entity_ids,
                 "payload": payload,
             },
-        )
-
-        _LOGGER.warning(
-            "[DRY RUN] Would apply to %s: %s (from slot: %s)",
-            climate_entity_id,
-            payload,
-            slot_label,
+            timestamp,
         )
 
     def emit_binding_matched(
@@ -256,6 +260,7 @@ class EventEmitter:
         match_value: str,
         priority: int,
         target_entities: list[str] | None = None,
+        timestamp: str | None = None,
     ) -> None:
         """
         Emit binding matched event (when calendar event matches binding pattern).
@@ -270,6 +275,7 @@ class EventEmitter:
             match_value: Match pattern value
             priority: Binding priority
             target_entities: Specific target entities (None = global pool)
+            timestamp: Evaluation cycle timestamp (defaults to now)
         """
         self._emit_event(
             EVENT_BINDING_MATCHED,
@@ -284,6 +290,7 @@ class EventEmitter:
                 "priority": priority,
                 "target_entities": target_entities or "global_pool",
             },
+            timestamp,
         )
 
         _LOGGER.info(
@@ -303,6 +310,7 @@ class EventEmitter:
         forced_slot_id: str | None = None,
         dry_run: bool = True,
         debug_mode: bool = False,
+        timestamp: str | None = None,
     ) -> None:
         """
         Emit evaluation complete event (summary of evaluation cycle).
@@ -314,6 +322,7 @@ class EventEmitter:
             forced_slot_id: Forced slot ID if force_slot flag active
             dry_run: Dry run mode status
             debug_mode: Debug mode status
+            timestamp: Evaluation cycle timestamp (defaults to now)
         """
         self._emit_event(
             EVENT_EVALUATION_COMPLETE,
@@ -326,16 +335,18 @@ class EventEmitter:
                 "dry_run": dry_run,
                 "debug_mode": debug_mode,
             },
+            timestamp,
         )
 
-        _LOGGER.info(
-            "Evaluation complete: %d events → %d bindings matched → %d entities | Forced: %s | Dry run: %s",
-            active_events_count,
-            bindings_matched,
-            entities_applied,
-            forced_slot_id or "No",
-            "Yes" if dry_run else "No",
-        )
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info(
+                "Evaluation complete: %d events → %d bindings matched → %d entities | Forced: %s | Dry run: %s",
+                active_events_count,
+                bindings_matched,
+                entities_applied,
+                forced_slot_id or "No",
+                "Yes" if dry_run else "No",
+            )
 
     def reset_deduplication(self) -> None:
         """Reset internal deduplication state (useful for testing)."""
@@ -1,7 +1,7 @@
 """Helper functions for Climate Control Calendar integration."""
 import hashlib
 import logging
-from datetime import datetime, time
+import time
 from typing import Any
 
 from homeassistant.core import HomeAssistant
@@ -19,10 +19,19 @@ from .const import (
 
 _LOGGER = logging.getLogger(__name__)
 
+# Climate payload fields, at least one of which must be present
+_VALID_PAYLOAD_KEYS = frozenset({
+    PAYLOAD_TEMPERATURE,
+    PAYLOAD_HVAC_MODE,
+    PAYLOAD_PRESET_MODE,
+    "fan_mode",
+    "swing_mode",
+})
+
 
 def generate_slot_id(label: str, timestamp: float | None = None) -> str:
     """
-    Generate stable slot ID using SHA256 truncated to 12 hex characters.
+    Generate stable slot ID as a 48-bit BLAKE2b digest (12 hex characters).
 
     Args:
         label: Human-readable slot label
@@ -32,11 +41,11 @@ def generate_slot_id(label: str, timestamp: float | None = None) -> str:
         12-character hexadecimal slot ID
     """
     if timestamp is None:
-        timestamp = datetime.now().timestamp()
+        timestamp = time.time()
 
     source = f"{label}_{timestamp}"
-    hash_full = hashlib.sha256(source.encode()).hexdigest()
-    return hash_full[:12]
+    # digest_size=6 yields exactly 12 hex chars without hashing bits we drop
+    return hashlib.blake2b(source.encode(), digest_size=6).hexdigest()
 
 
 # REMOVED: validate_time_string(), parse_time_string(), time_to_string() (Decision D034)
@@ -55,12 +64,11 @@ def validate_slot_data(slot_data: dict[str, Any]) -> tuple[bool, str | None]:
     Returns:
         Tuple of (is_valid, error_message)
     """
-    # Check required fields
-    if SLOT_LABEL not in slot_data:
-        return False, "Missing required field: label"
-
-    # Validate label not empty
-    if not slot_data[SLOT_LABEL].strip():
+    # Cheap presence/emptiness checks first, with a single label lookup
+    label = slot_data.get(SLOT_LABEL)
+    if not label or not label.strip():
+        if label is None:
+            return False, "Missing required field: label"
         return False, "Slot label cannot be empty"
 
     # Validate default_climate_payload (or legacy climate_payload)
@@ -91,19 +99,7 @@ def get_calendar_entities(hass: HomeAssistant) -> list[str]:
     Returns:
         List of calendar entity IDs
     """
-    entity_reg = er.async_get(hass)
-    calendar_entities = []
-
-    for entity in entity_reg.entities.values():
-        if entity.domain == "calendar":
-            calendar_entities.append(entity.entity_id)
-
-    # Also check current states for calendars not in registry
-    for entity_id in hass.states.async_entity_ids("calendar"):
-        if entity_id not in calendar_entities:
-            calendar_entities.append(entity_id)
-
-    return sorted(calendar_entities)
+    return _get_domain_entities(hass, "calendar")
 
 
 def get_climate_entities(hass: HomeAssistant) -> list[str]:
@@ -116,19 +112,37 @@ def get_climate_entities(hass: HomeAssistant) -> list[str]:
     Returns:
         List of climate entity IDs
     """
-    entity_reg = er.async_get(hass)
-    climate_entities = []
+    return _get_domain_entities(hass, "climate")
 
-    for entity in entity_reg.entities.values():
-        if entity.domain == "climate":
-            climate_entities.append(entity.entity_id)
 
-    # Also check current states for climate entities not in registry
-    for entity_id in hass.states.async_entity_ids("climate"):
-        if entity_id not in climate_entities:
-            climate_entities.append(entity_id)
+def _get_domain_entities(hass: HomeAssistant, domain: str) -> list[str]:
+    """
+    Get sorted entity IDs for a domain.
 
-    return sorted(climate_entities)
+    Combines current states with the entity registry (for registered
+    entities without a state).
+
+    Args:
+        hass: Home Assistant instance
+        domain: Entity domain (e.g. "calendar", "climate")
+
+    Returns:
+        Sorted list of entity IDs
+    """
+    # States are indexed by domain, so this is O(entities in the domain)
+    entity_ids = set(hass.states.async_entity_ids(domain))
+
+    # Supplement with registered entities that currently have no state
+    # (e.g. disabled). The registry has no domain index, but it is keyed
+    # by entity ID, so a prefix test avoids loading each entry.
+    prefix = f"{domain}."
+    entity_ids.update(
+        entity_id
+        for entity_id in er.async_get(hass).entities
+        if entity_id.startswith(prefix)
+    )
+
+    return sorted(entity_ids)
 
 
 def format_slot_summary(slot_data: dict[str, Any]) -> str:
@@ -164,26 +178,18 @@ def validate_climate_payload(payload: dict[str, Any]) -> tuple[bool, str | None]
     if not payload:
         return False, "Climate payload cannot be empty (at least one field required)"
 
-    # Valid payload keys
-    valid_keys = [
-        PAYLOAD_TEMPERATURE,
-        PAYLOAD_HVAC_MODE,
-        PAYLOAD_PRESET_MODE,
-        "fan_mode",
-        "swing_mode",
-    ]
-
     # Check at least one valid key present
-    has_valid_key = any(key in payload for key in valid_keys)
-    if not has_valid_key:
-        return False, f"Climate payload must contain at least one valid field: {valid_keys}"
+    if _VALID_PAYLOAD_KEYS.isdisjoint(payload):
+        return False, f"Climate payload must contain at least one valid field: {sorted(_VALID_PAYLOAD_KEYS)}"
 
     # Validate temperature if present
     if PAYLOAD_TEMPERATURE in payload:
         temp = payload[PAYLOAD_TEMPERATURE]
-        if not isinstance(temp, (int, float)):
-            return False, f"Temperature must be numeric, got: {type(temp).__name__}"
-        if temp < -50 or temp > 50:
+        temp_type = type(temp)
+        # Exact float/int (JSON values) first, isinstance only for subclasses
+        if temp_type is not float and temp_type is not int and not isinstance(temp, (int, float)):
+            return False, f"Temperature must be numeric, got: {temp_type.__name__}"
+        if not -50 <= temp <= 50:
             return False, f"Temperature out of range (-50 to 50): {temp}"
 
     return True, None
@@ -196,3 +202,12 @@ def validate_climate_payload(payload: dict[str, Any]) -> tuple[bool, str | None]
 # REMOVED: validate_slot_overlap() - No longer needed (Decision D034)
 # With event-to-slot binding system, multiple slots can coexist without conflicts.
 # Conflicts are resolved via binding priority, not time-based overlap prevention.
+
+__all__ = [
+    "format_slot_summary",
+    "generate_slot_id",
+    "get_calendar_entities",
+    "get_climate_entities",
+    "validate_climate_payload",
+    "validate_slot_data",
+]
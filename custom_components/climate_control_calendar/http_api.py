@@ -1,16 +1,22 @@
 """HTTP API endpoints for Climate Control Calendar frontend."""
+from datetime import datetime
+import hashlib
 import logging
 import json
 from pathlib import Path
 from typing import Any
 
-from aiohttp import web
+from aiohttp import hdrs, web
 from homeassistant.components.http import HomeAssistantView
+from homeassistant.const import CONTENT_TYPE_JSON
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.http import KEY_HASS
+from homeassistant.helpers.json import json_bytes
 
 from .const import (
     DOMAIN,
     DATA_CONFIG,
+    DATA_CONFIG_JSON,
     DATA_ENGINE,
     DATA_COORDINATOR,
     CONF_SLOTS,
@@ -20,8 +26,47 @@ from .const import (
 
 _LOGGER = logging.getLogger(__name__)
 
-# Log module import
-_LOGGER.warning("🔥 http_api.py MODULE LOADED - This should appear in logs!")
+# POST /config fields as (request key, config entry key)
+# Data holds immutable fields: calendars, dry_run, debug_mode
+_POST_DATA_KEYS = (
+    ("calendar_entities", CONF_CALENDAR_ENTITIES),
+    ("dry_run", "dry_run"),
+    ("debug_mode", "debug_mode"),
+)
+# Options hold mutable fields: climate_entities, calendar_configs, slots, bindings
+_POST_OPTIONS_KEYS = (
+    ("climate_entities", "climate_entities"),
+    ("calendar_configs", "calendar_configs"),
+    ("slots", CONF_SLOTS),
+    ("bindings", CONF_BINDINGS),
+)
+
+# Translation files shipped with the integration
+_TRANSLATIONS_DIR = Path(__file__).parent / "translations"
+
+# Web UI translation sections, keyed by requested language
+# Format: dict[language] = (encoded webui section, quoted ETag)
+_TRANSLATIONS_CACHE: dict[str, tuple[bytes, str]] = {}
+_TRANSLATIONS_CACHE_MAX_LANGUAGES = 32
+
+
+def _get_primary_entry(hass: HomeAssistant) -> tuple[str, dict[str, Any]] | None:
+    """
+    Get the first loaded config entry's ID and data.
+
+    The web UI manages a single entry; hass.data keeps entries in setup
+    order, so this is an O(1) lookup instead of a loop over all entries.
+
+    Args:
+        hass: Home Assistant instance
+
+    Returns:
+        Tuple of (entry_id, entry_data) or None if no entry is loaded
+    """
+    return next(iter(hass.data.get(DOMAIN, {}).items()), None)
+
+
+_LOGGER.debug("HTTP API module loaded")
 
 
 class ClimateControlConfigView(HomeAssistantView):
@@ -31,44 +76,51 @@ class ClimateControlConfigView(HomeAssistantView):
     name = f"api:{DOMAIN}:config"
     requires_auth = True
 
-    def __init__(self, hass: HomeAssistant):
-        """Initialize the view."""
-        self.hass = hass
-        _LOGGER.warning("🔥 ClimateControlConfigView.__init__ called")
-
     async def get(self, request: web.Request) -> web.Response:
         """Handle GET request for configuration data."""
-        _LOGGER.warning("🔥 HTTP API: GET /api/%s/config - REQUEST RECEIVED!", DOMAIN)
+        _LOGGER.debug("HTTP API: GET /api/%s/config", DOMAIN)
+        hass = request.app[KEY_HASS]
 
         try:
             # Get first available config entry data
-            for entry_data in self.hass.data.get(DOMAIN, {}).values():
-                config = entry_data.get(DATA_CONFIG, {})
-
-                slots = config.get(CONF_SLOTS, [])
-                bindings = config.get(CONF_BINDINGS, [])
-                calendars = config.get(CONF_CALENDAR_ENTITIES, [])
-                climate_entities = config.get("climate_entities", [])
-                calendar_configs = config.get("calendar_configs", {})
-                dry_run = config.get("dry_run", True)
-                debug_mode = config.get("debug_mode", False)
-
-                _LOGGER.info(
-                    "HTTP API: Returning config - slots=%d, bindings=%d, calendars=%d",
-                    len(slots),
-                    len(bindings),
-                    len(calendars),
-                )
-
-                return self.json({
-                    "slots": slots,
-                    "bindings": bindings,
-                    "calendars": calendars,
-                    "climate_entities": climate_entities,
-                    "calendar_configs": calendar_configs,
-                    "dry_run": dry_run,
-                    "debug_mode": debug_mode,
-                })
+            primary = _get_primary_entry(hass)
+            if primary is not None:
+                entry_data = primary[1]
+
+                # The body is reusable until the config changes: an entry
+                # reload replaces entry_data, and POST /config and the
+                # binding manager drop it when they persist changes
+                body = entry_data.get(DATA_CONFIG_JSON)
+                if body is None:
+                    config = entry_data.get(DATA_CONFIG, {})
+
+                    slots = config.get(CONF_SLOTS, [])
+                    bindings = config.get(CONF_BINDINGS, [])
+                    calendars = config.get(CONF_CALENDAR_ENTITIES, [])
+                    climate_entities = config.get("climate_entities", [])
+                    calendar_configs = config.get("calendar_configs", {})
+                    dry_run = config.get("dry_run", True)
+                    debug_mode = config.get("debug_mode", False)
+
+                    _LOGGER.info(
+                        "HTTP API: Returning config - slots=%d, bindings=%d, calendars=%d",
+                        len(slots),
+                        len(bindings),
+                        len(calendars),
+                    )
+
+                    body = json_bytes({
+                        "slots": slots,
+                        "bindings": bindings,
+                        "calendars": calendars,
+                        "climate_entities": climate_entities,
+                        "calendar_configs": calendar_configs,
+                        "dry_run": dry_run,
+                        "debug_mode": debug_mode,
+                    })
+                    entry_data[DATA_CONFIG_JSON] = body
+
+                return web.Response(body=body, content_type=CONTENT_TYPE_JSON)
 
             # No config found
             _LOGGER.warning("HTTP API: No config data found")
@@ -90,48 +142,46 @@ class ClimateControlConfigView(HomeAssistantView):
 
     async def post(self, request: web.Request) -> web.Response:
         """Handle POST request to update basic configuration."""
-        _LOGGER.warning("🔥 HTTP API: POST /api/%s/config - REQUEST RECEIVED!", DOMAIN)
+        _LOGGER.debug("HTTP API: POST /api/%s/config", DOMAIN)
+        hass = request.app[KEY_HASS]
 
         try:
             data = await request.json()
             _LOGGER.info("HTTP API: Received update data: %s", data)
 
             # Get first config entry
-            config_entry = None
-            for entry_id in self.hass.data.get(DOMAIN, {}).keys():
-                config_entry = self.hass.config_entries.async_get_entry(entry_id)
-                if config_entry:
-                    break
+            primary = _get_primary_entry(hass)
+            config_entry = (
+                hass.config_entries.async_get_entry(primary[0])
+                if primary is not None
+                else None
+            )
 
             if not config_entry:
                 return self.json_message("No config entry found", status_code=404)
 
-            # Update data (immutable fields: calendars, dry_run, debug_mode)
-            new_data = {**config_entry.data}
-            if "calendar_entities" in data:
-                new_data[CONF_CALENDAR_ENTITIES] = data["calendar_entities"]
-            if "dry_run" in data:
-                new_data["dry_run"] = data["dry_run"]
-            if "debug_mode" in data:
-                new_data["debug_mode"] = data["debug_mode"]
-
-            # Update options (mutable fields: climate_entities, calendar_configs, slots, bindings)
-            new_options = {**config_entry.options}
-            if "climate_entities" in data:
-                new_options["climate_entities"] = data["climate_entities"]
-            if "calendar_configs" in data:
-                new_options["calendar_configs"] = data["calendar_configs"]
-            if "slots" in data:
-                new_options[CONF_SLOTS] = data["slots"]
-            if "bindings" in data:
-                new_options[CONF_BINDINGS] = data["bindings"]
-
-            # Apply updates
-            self.hass.config_entries.async_update_entry(
-                config_entry,
-                data=new_data,
-                options=new_options,
-            )
+            # Collect only the fields present in the request
+            data_delta = {
+                entry_key: data[request_key]
+                for request_key, entry_key in _POST_DATA_KEYS
+                if request_key in data
+            }
+            options_delta = {
+                entry_key: data[request_key]
+                for request_key, entry_key in _POST_OPTIONS_KEYS
+                if request_key in data
+            }
+
+            # Apply updates, copying data/options only when they change
+            updates: dict[str, Any] = {}
+            if data_delta:
+                updates["data"] = {**config_entry.data, **data_delta}
+            if options_delta:
+                updates["options"] = {**config_entry.options, **options_delta}
+            hass.config_entries.async_update_entry(config_entry, **updates)
+
+            # Don't serve the old body while the entry reloads
+            primary[1].pop(DATA_CONFIG_JSON, None)
 
             _LOGGER.info("HTTP API: Config updated successfully")
             return self.json({"status": "ok", "message": "Configuration updated"})
@@ -151,18 +201,19 @@ class ClimateControlStatusView(HomeAssistantView):
     name = f"api:{DOMAIN}:status"
     requires_auth = True
 
-    def __init__(self, hass: HomeAssistant):
-        """Initialize the view."""
-        self.hass = hass
-        _LOGGER.warning("🔥 ClimateControlStatusView.__init__ called")
-
     async def get(self, request: web.Request) -> web.Response:
         """Handle GET request for status/monitoring data."""
-        _LOGGER.info("HTTP API: GET /api/%s/status - REQUEST RECEIVED!", DOMAIN)
+        _LOGGER.debug("HTTP API: GET /api/%s/status", DOMAIN)
+        hass = request.app[KEY_HASS]
 
         try:
+            # One timestamp for the whole response
+            now = datetime.now()
+
             # Get first available config entry data
-            for entry_data in self.hass.data.get(DOMAIN, {}).values():
+            primary = _get_primary_entry(hass)
+            if primary is not None:
+                entry_data = primary[1]
                 config = entry_data.get(DATA_CONFIG, {})
                 engine = entry_data.get(DATA_ENGINE)
                 coordinator = entry_data.get(DATA_COORDINATOR)
@@ -173,27 +224,30 @@ class ClimateControlStatusView(HomeAssistantView):
                 calendars = config.get(CONF_CALENDAR_ENTITIES, [])
                 climate_entities = config.get("climate_entities", [])
 
-                # Get climate entities states
+                # Get climate entities states (attributes and datetimes go
+                # to the orjson-based encoder as is, without copies/isoformat)
+                get_state = hass.states.get
                 climate_states = []
+                climates_on = 0
                 for entity_id in climate_entities:
-                    state = self.hass.states.get(entity_id)
+                    state = get_state(entity_id)
                     if state:
+                        if state.state != "off":
+                            climates_on += 1
                         climate_states.append({
                             "entity_id": entity_id,
                             "state": state.state,
-                            "attributes": dict(state.attributes),
-                            "last_changed": state.last_changed.isoformat(),
-                            "last_updated": state.last_updated.isoformat(),
+                            "attributes": state.attributes,
+                            "last_changed": state.last_changed,
+                            "last_updated": state.last_updated,
                         })
 
                 # Get active calendar events
                 active_events = []
-                from datetime import datetime, timedelta
-                now = datetime.now()
 
                 for calendar_id in calendars:
                     # Get calendar state
-                    cal_state = self.hass.states.get(calendar_id)
+                    cal_state = get_state(calendar_id)
                     if cal_state and cal_state.state == "on":
                         # Calendar has an active event
                         attrs = cal_state.attributes
@@ -214,13 +268,12 @@ class ClimateControlStatusView(HomeAssistantView):
                     "active_slot": None,
                 }
 
-                if engine and hasattr(engine, '_last_evaluation_time'):
-                    engine_state["last_evaluation"] = engine._last_evaluation_time.isoformat() if engine._last_evaluation_time else None
+                last_evaluation = getattr(engine, "_last_evaluation_time", None)
+                if last_evaluation:
+                    engine_state["last_evaluation"] = last_evaluation.isoformat()
 
                 # Get matched bindings (from last evaluation if available)
-                matched_bindings = []
-                if engine and hasattr(engine, '_last_matched_bindings'):
-                    matched_bindings = engine._last_matched_bindings or []
+                matched_bindings = getattr(engine, "_last_matched_bindings", None) or []
 
                 return self.json({
                     "timestamp": now.isoformat(),
@@ -234,14 +287,14 @@ class ClimateControlStatusView(HomeAssistantView):
                         "total_calendars": len(calendars),
                         "total_climates": len(climate_entities),
                         "active_events_count": len(active_events),
-                        "climates_on": len([c for c in climate_states if c["state"] != "off"]),
+                        "climates_on": climates_on,
                     }
                 })
 
             # No config found
             _LOGGER.warning("HTTP API: No status data found")
             return self.json({
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": now.isoformat(),
                 "active_events": [],
                 "climate_states": [],
                 "matched_bindings": [],
@@ -264,6 +317,36 @@ class ClimateControlStatusView(HomeAssistantView):
             )
 
 
+def _load_webui_translations(language: str) -> tuple[str, dict[str, Any]] | None:
+    """Read the translation file for a language and return its webui section.
+
+    Falls back to English when the language has no translation file. Does
+    blocking file I/O, so it must run in the executor.
+
+    Args:
+        language: Requested language code
+
+    Returns:
+        Tuple of (language actually loaded, webui section), or None if
+        neither the language nor English has a translation file
+    """
+    translation_file = _TRANSLATIONS_DIR / f"{language}.json"
+
+    # Default to English if language not found
+    if not translation_file.exists():
+        _LOGGER.warning("Translation file not found for language '%s', falling back to 'en'", language)
+        translation_file = _TRANSLATIONS_DIR / "en.json"
+
+    if not translation_file.exists():
+        return None
+
+    with open(translation_file, "r", encoding="utf-8") as f:
+        translations = json.load(f)
+
+    # Keep only the webui section
+    return translation_file.stem, translations.get("webui", {})
+
+
 class ClimateControlTranslationsView(HomeAssistantView):
     """View to serve translation files for the web UI."""
 
@@ -271,37 +354,47 @@ class ClimateControlTranslationsView(HomeAssistantView):
     name = f"api:{DOMAIN}:translations"
     requires_auth = False  # Translations are public
 
-    def __init__(self, hass: HomeAssistant):
-        """Initialize the view."""
-        self.hass = hass
-
     async def get(self, request: web.Request, language: str) -> web.Response:
         """Handle GET request for translation file."""
         try:
-            # Get the translations directory path
-            translations_dir = Path(__file__).parent / "translations"
-            translation_file = translations_dir / f"{language}.json"
-
-            # Default to English if language not found
-            if not translation_file.exists():
-                _LOGGER.warning("Translation file not found for language '%s', falling back to 'en'", language)
-                translation_file = translations_dir / "en.json"
-
-            if not translation_file.exists():
-                return self.json_message(
-                    f"Translation file not found for language: {language}",
-                    status_code=404
+            # Translation files ship with the integration and don't change
+            # while it runs, so each language is resolved, read and parsed once
+            cached = _TRANSLATIONS_CACHE.get(language)
+            if cached is None:
+                hass = request.app[KEY_HASS]
+                loaded = await hass.async_add_executor_job(
+                    _load_webui_translations, language
                 )
-
-            # Read and return the translation file
-            with open(translation_file, "r", encoding="utf-8") as f:
-                translations = json.load(f)
-
-            # Return only the webui section
-            webui_translations = translations.get("webui", {})
-
-            _LOGGER.info("Served translations for language: %s", language)
-            return self.json(webui_translations)
+                if loaded is None:
+                    return self.json_message(
+                        f"Translation file not found for language: {language}",
+                        status_code=404
+                    )
+
+                # Languages falling back to English share its cached entry
+                loaded_language, webui_translations = loaded
+                cached = _TRANSLATIONS_CACHE.get(loaded_language)
+                if cached is None:
+                    body = json_bytes(webui_translations)
+                    digest = hashlib.blake2b(body, digest_size=16).hexdigest()
+                    cached = (body, f'"{digest}"')
+                    _TRANSLATIONS_CACHE[loaded_language] = cached
+                # The endpoint is public: bound how many requested names are kept
+                if len(_TRANSLATIONS_CACHE) < _TRANSLATIONS_CACHE_MAX_LANGUAGES:
+                    _TRANSLATIONS_CACHE[language] = cached
+
+            body, etag = cached
+            # Browsers revalidate on each load; unchanged content costs a 304
+            headers = {hdrs.ETAG: etag, hdrs.CACHE_CONTROL: "no-cache"}
+
+            if_none_match = request.headers.get(hdrs.IF_NONE_MATCH, "")
+            if etag in (tag.strip() for tag in if_none_match.split(",")):
+                return web.Response(status=304, headers=headers)
+
+            _LOGGER.debug("Served translations for language: %s", language)
+            return web.Response(
+                body=body, content_type=CONTENT_TYPE_JSON, headers=headers
+            )
 
         except Exception as err:
             _LOGGER.error("Error serving translations: %s", err, exc_info=True)
@@ -313,21 +406,23 @@ class ClimateControlTranslationsView(HomeAssistantView):
 
 async def async_register_api(hass: HomeAssistant) -> None:
     """Register HTTP API endpoints."""
-    _LOGGER.warning("🔥 async_register_api CALLED - Registering HTTP API for %s", DOMAIN)
+    _LOGGER.debug("Registering HTTP API for %s", DOMAIN)
 
     # Register config endpoint
-    config_view = ClimateControlConfigView(hass)
+    config_view = ClimateControlConfigView()
     hass.http.register_view(config_view)
 
     # Register status endpoint
-    status_view = ClimateControlStatusView(hass)
+    status_view = ClimateControlStatusView()
     hass.http.register_view(status_view)
 
     # Register translations endpoint
-    translations_view = ClimateControlTranslationsView(hass)
+    translations_view = ClimateControlTranslationsView()
     hass.http.register_view(translations_view)
 
-    _LOGGER.warning("🔥 HTTP API VIEWS REGISTERED:")
-    _LOGGER.warning("🔥   - /api/%s/config", DOMAIN)
-    _LOGGER.warning("🔥   - /api/%s/status", DOMAIN)
-    _LOGGER.warning("🔥   - /api/%s/translations/{language}", DOMAIN)
+    _LOGGER.debug(
+        "HTTP API views registered: /api/%s/config, /api/%s/status, /api/%s/translations/{language}",
+        DOMAIN,
+        DOMAIN,
+        DOMAIN,
+    )
@@ -1,16 +1,41 @@
 """Panel registration for Climate Control Calendar."""
+import hashlib
 import logging
 from pathlib import Path
 
-from homeassistant.components.frontend import async_register_built_in_panel
+from homeassistant.components.frontend import (
+    async_register_built_in_panel,
+    async_remove_panel,
+)
 from homeassistant.components.http import StaticPathConfig
 from homeassistant.core import HomeAssistant
 
-from .const import DOMAIN, VERSION
+from .const import DOMAIN
 from .http_api import async_register_api
 
 _LOGGER = logging.getLogger(__name__)
 
+# Static frontend files served at /{DOMAIN}/static
+_WWW_PATH = Path(__file__).parent / "www"
+
+# Panel script, served on its own route so it can be browser-cached
+_PANEL_JS_PATH = _WWW_PATH / "climate-panel.js"
+_PANEL_JS_URL = f"/{DOMAIN}/panel/climate-panel.js"
+
+
+def _file_digest(path: Path) -> str:
+    """Hash a file's content for use as a cache-busting version.
+
+    Does blocking file I/O, so it must run in the executor.
+
+    Args:
+        path: File to hash
+
+    Returns:
+        16-character hexadecimal digest
+    """
+    return hashlib.blake2b(path.read_bytes(), digest_size=8).hexdigest()
+
 
 async def async_register_panel(hass: HomeAssistant) -> None:
     """Register the Climate Control Calendar panel in the Home Assistant sidebar.
@@ -18,37 +43,38 @@ async def async_register_panel(hass: HomeAssistant) -> None:
     This creates a custom panel accessible from the sidebar that displays
     the test HTML interface for the integration.
     """
-    # Use WARNING to ensure it shows up in logs
-    _LOGGER.warning("🚀 PANEL REGISTRATION STARTING - Climate Control Calendar")
+    _LOGGER.debug("Registering Climate Control Calendar panel")
 
     try:
-        # Get the path to our www directory
-        integration_path = Path(__file__).parent
-        www_path = integration_path / "www"
-
-        _LOGGER.warning(
-            "📁 Registering Climate Control Calendar panel. WWW path: %s",
-            www_path
-        )
+        _LOGGER.debug("Panel WWW path: %s", _WWW_PATH)
 
-        # Step 1: Register static file path
+        # Step 1: Register static file paths
         # This makes files in /www available at /{DOMAIN}/static/
+        panel_js_version = await hass.async_add_executor_job(
+            _file_digest, _PANEL_JS_PATH
+        )
         await hass.http.async_register_static_paths([
             StaticPathConfig(
                 url_path=f"/{DOMAIN}/static",
-                path=str(www_path),
+                path=str(_WWW_PATH),
                 cache_headers=False,  # Disable caching for easier development
-            )
+            ),
+            # Long-lived browser caching: the panel JS URL carries a hash of
+            # the file, so any change to the script is fetched fresh
+            StaticPathConfig(
+                url_path=_PANEL_JS_URL,
+                path=str(_PANEL_JS_PATH),
+                cache_headers=True,
+            ),
         ])
-        _LOGGER.warning("✅ Static path registered: /%s/static -> %s", DOMAIN, www_path)
+        _LOGGER.debug("Static path registered: /%s/static -> %s", DOMAIN, _WWW_PATH)
 
         # Step 2: Register HTTP API for frontend data access
         await async_register_api(hass)
-        _LOGGER.warning("✅ HTTP API registered: /api/%s/config", DOMAIN)
+        _LOGGER.debug("HTTP API registered: /api/%s/config", DOMAIN)
 
         # Step 3: Register the panel in the sidebar
-        _LOGGER.warning("📋 Calling async_register_built_in_panel...")
-        _LOGGER.warning("📋 Using VERSION for cache busting: %s", VERSION)
+        _LOGGER.debug("Using panel JS hash for cache busting: %s", panel_js_version)
         async_register_built_in_panel(
             hass,
             component_name="custom",  # Use 'custom' for custom panels
@@ -61,14 +87,14 @@ async def async_register_panel(hass: HomeAssistant) -> None:
                     "name": "climate-panel-card",  # Custom element tag name
                     "embed_iframe": True,  # CRITICAL: Embed in iframe to avoid conflicts
                     "trust": False,  # Don't trust external content
-                    "js_url": f"/{DOMAIN}/static/climate-panel.js?v={VERSION}",  # Cache busting with version
+                    "js_url": f"{_PANEL_JS_URL}?v={panel_js_version}",  # Cache busting with content hash
                 }
             },
             require_admin=False,  # Allow non-admin users to see the panel
         )
 
-        _LOGGER.warning(
-            "✅ Climate Control Calendar panel registered successfully at /%s",
+        _LOGGER.info(
+            "Climate Control Calendar panel registered at /%s",
             DOMAIN
         )
 
@@ -83,8 +109,6 @@ async def async_register_panel(hass: HomeAssistant) -> None:
 
 async def async_unregister_panel(hass: HomeAssistant) -> None:
     """Unregister the panel when the integration is unloaded."""
-    from homeassistant.components.frontend import async_remove_panel
-
     try:
         # Check if panel exists before removing
         if hass.data.get("frontend_panels", {}).get(DOMAIN):
@@ -1,4 +1,5 @@
 """Service handlers for Climate Control Calendar integration."""
+import asyncio
 import logging
 from typing import Any
 
@@ -93,6 +94,26 @@ SERVICE_REMOVE_BINDING_SCHEMA = vol.Schema(
 
 SERVICE_LIST_BINDINGS_SCHEMA = vol.Schema({})  # No parameters
 
+SERVICE_GET_CONFIG_SCHEMA = vol.Schema({})  # No parameters
+
+
+def _entries_with(hass: HomeAssistant, key: str) -> list[dict[str, Any]]:
+    """
+    Get the data dicts of loaded config entries that provide a component.
+
+    Args:
+        hass: Home Assistant instance
+        key: Component key in the entry data (e.g. DATA_COORDINATOR)
+
+    Returns:
+        Entry data dicts where the component is set, in setup order
+    """
+    return [
+        entry_data
+        for entry_data in hass.data.get(DOMAIN, {}).values()
+        if entry_data.get(key)
+    ]
+
 
 def get_service_schemas() -> dict[str, vol.Schema]:
     """
@@ -107,6 +128,7 @@ def get_service_schemas() -> dict[str, vol.Schema]:
         SERVICE_ADD_BINDING: SERVICE_ADD_BINDING_SCHEMA,
         SERVICE_REMOVE_BINDING: SERVICE_REMOVE_BINDING_SCHEMA,
         SERVICE_LIST_BINDINGS: SERVICE_LIST_BINDINGS_SCHEMA,
+        SERVICE_GET_CONFIG: SERVICE_GET_CONFIG_SCHEMA,
     }
 
 
@@ -168,11 +190,13 @@ async def async_setup_services(hass: HomeAssistant) -> None:
 
         _LOGGER.info("Slot added successfully: %s (ID: %s)", label, slot_id)
 
-        # Force refresh to apply immediately
-        for entry_data in hass.data.get(DOMAIN, {}).values():
-            coordinator = entry_data.get(DATA_COORDINATOR)
-            if coordinator:
-                await coordinator.async_request_refresh()
+        # Force refresh to apply immediately (entries are independent, refresh concurrently)
+        await asyncio.gather(
+            *(
+                entry_data[DATA_COORDINATOR].async_request_refresh()
+                for entry_data in _entries_with(hass, DATA_COORDINATOR)
+            )
+        )
 
     async def handle_remove_slot(call: ServiceCall) -> None:
         """Handle remove_slot service call."""
@@ -203,11 +227,13 @@ async def async_setup_services(hass: HomeAssistant) -> None:
 
         _LOGGER.info("Slot removed successfully: %s", slot_id)
 
-        # Force refresh
-        for entry_data in hass.data.get(DOMAIN, {}).values():
-            coordinator = entry_data.get(DATA_COORDINATOR)
-            if coordinator:
-                await coordinator.async_request_refresh()
+        # Force refresh (entries are independent, refresh concurrently)
+        await asyncio.gather(
+            *(
+                entry_data[DATA_COORDINATOR].async_request_refresh()
+                for entry_data in _entries_with(hass, DATA_COORDINATOR)
+            )
+        )
 
     async def handle_add_binding(call: ServiceCall) -> None:
         """
@@ -231,28 +257,27 @@ async def async_setup_services(hass: HomeAssistant) -> None:
         )
 
         # Add binding via binding manager
-        for entry_data in hass.data.get(DOMAIN, {}).values():
-            binding_manager = entry_data.get(DATA_BINDING_MANAGER)
-            if binding_manager:
-                try:
-                    binding_id = await binding_manager.async_add_binding(
-                        calendars=calendars,
-                        match_config=match_config,
-                        slot_id=slot_id,
-                        target_entities=target_entities,  # New parameter
-                        priority=priority,  # Can be None
-                    )
-                    _LOGGER.info("Binding added successfully: %s", binding_id)
-
-                    # Force refresh to apply immediately
-                    coordinator = entry_data.get(DATA_COORDINATOR)
-                    if coordinator:
-                        await coordinator.async_request_refresh()
-
-                    return  # Success
-                except Exception as err:
-                    _LOGGER.error("Failed to add binding: %s", err)
-                    raise vol.Invalid(f"Failed to add binding: {err}")
+        for entry_data in _entries_with(hass, DATA_BINDING_MANAGER):
+            binding_manager = entry_data[DATA_BINDING_MANAGER]
+            try:
+                binding_id = await binding_manager.async_add_binding(
+                    calendars=calendars,
+                    match_config=match_config,
+                    slot_id=slot_id,
+                    target_entities=target_entities,  # New parameter
+                    priority=priority,  # Can be None
+                )
+                _LOGGER.info("Binding added successfully: %s", binding_id)
+
+                # Force refresh to apply immediately
+                coordinator = entry_data.get(DATA_COORDINATOR)
+                if coordinator:
+                    await coordinator.async_request_refresh()
+
+                return  # Success
+            except Exception as err:
+                _LOGGER.error("Failed to add binding: %s", err)
+                raise vol.Invalid(f"Failed to add binding: {err}")
 
         _LOGGER.error("No binding manager found")
         raise vol.Invalid("Binding manager not available")
@@ -264,22 +289,21 @@ async def async_setup_services(hass: HomeAssistant) -> None:
         _LOGGER.info("Service call: remove_binding | binding_id=%s", binding_id)
 
         # Remove binding via binding manager
-        for entry_data in hass.data.get(DOMAIN, {}).values():
-            binding_manager = entry_data.get(DATA_BINDING_MANAGER)
-            if binding_manager:
-                success = await binding_manager.async_remove_binding(binding_id)
-                if success:
-                    _LOGGER.info("Binding removed successfully: %s", binding_id)
-
-                    # Force refresh
-                    coordinator = entry_data.get(DATA_COORDINATOR)
-                    if coordinator:
-                        await coordinator.async_request_refresh()
-
-                    return  # Success
-                else:
-                    _LOGGER.warning("Binding ID not found: %s", binding_id)
-                    raise vol.Invalid(f"Binding ID not found: {binding_id}")
+        for entry_data in _entries_with(hass, DATA_BINDING_MANAGER):
+            binding_manager = entry_data[DATA_BINDING_MANAGER]
+            success = await binding_manager.async_remove_binding(binding_id)
+            if success:
+                _LOGGER.info("Binding removed successfully: %s", binding_id)
+
+                # Force refresh
+                coordinator = entry_data.get(DATA_COORDINATOR)
+                if coordinator:
+                    await coordinator.async_request_refresh()
+
+                return  # Success
+            else:
+                _LOGGER.warning("Binding ID not found: %s", binding_id)
+                raise vol.Invalid(f"Binding ID not found: {binding_id}")
 
         _LOGGER.error("No binding manager found")
         raise vol.Invalid("Binding manager not available")
@@ -294,12 +318,11 @@ async def async_setup_services(hass: HomeAssistant) -> None:
         _LOGGER.info("Service call: list_bindings")
 
         # Get bindings from binding manager
-        for entry_data in hass.data.get(DOMAIN, {}).values():
-            binding_manager = entry_data.get(DATA_BINDING_MANAGER)
-            if binding_manager:
-                bindings = binding_manager.get_all_bindings()
-                _LOGGER.info("Returning %d bindings", len(bindings))
-                return {"bindings": bindings}
+        for entry_data in _entries_with(hass, DATA_BINDING_MANAGER):
+            binding_manager = entry_data[DATA_BINDING_MANAGER]
+            bindings = binding_manager.get_all_bindings()
+            _LOGGER.info("Returning %d bindings", len(bindings))
+            return {"bindings": bindings}
 
         _LOGGER.warning("No binding manager found")
         return {"bindings": []}
@@ -383,7 +406,7 @@ async def async_setup_services(hass: HomeAssistant) -> None:
         DOMAIN,
         SERVICE_GET_CONFIG,
         handle_get_config,
-        schema=vol.Schema({}),  # No parameters needed
+        schema=SERVICE_GET_CONFIG_SCHEMA,
         supports_response=True,  # This service returns data
     )
 
@@ -130,6 +130,11 @@ def render_climate_payload(
         if value is None:
             continue
 
+        # Only strings can be templates: pass numbers/bools straight through
+        if not isinstance(value, str):
+            rendered[key] = value
+            continue
+
         expected_type = field_types.get(key)
         rendered[key] = render_template_value(hass, value, key, expected_type)
 
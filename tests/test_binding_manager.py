@@ -0,0 +1,36 @@
+"""Unit tests for binding_manager.py"""
+import pytest
+from unittest.mock import Mock
+from custom_components.climate_control_calendar.binding_manager import BindingManager
+
+
+@pytest.fixture
+def binding_manager():
+    """Create a BindingManager with a mock Home Assistant instance."""
+    return BindingManager(hass=Mock(), entry_id="test_entry")
+
+
+class TestFindSlotById:
+    """Test slot lookup through the slot ID index."""
+
+    def test_first_slot_wins(self, binding_manager):
+        """Test that the first slot with a duplicate ID is returned."""
+        slots = [{"id": "a", "label": "first"}, {"id": "a", "label": "second"}]
+        assert binding_manager._find_slot_by_id(slots, "a")["label"] == "first"
+
+    def test_slot_id_edited_in_place(self, binding_manager):
+        """Test that an in-place ID change is not served from the index."""
+        slots = [{"id": "a"}, {"id": "b"}]
+        assert binding_manager._find_slot_by_id(slots, "a") is slots[0]
+
+        slots[0]["id"] = "c"
+        assert binding_manager._find_slot_by_id(slots, "a") is None
+        assert binding_manager._find_slot_by_id(slots, "c") is slots[0]
+
+    def test_list_replaced_with_same_length(self, binding_manager):
+        """Test that a different list of the same length is indexed afresh."""
+        assert binding_manager._find_slot_by_id([{"id": "a"}, {"id": "b"}], "b")
+
+        slots = [{"id": "b"}, {"id": "a"}]
+        assert binding_manager._find_slot_by_id(slots, "b") is slots[0]
+        assert binding_manager._find_slot_by_id(slots, "x") is None
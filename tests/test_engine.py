@@ -391,7 +391,7 @@ class TestDryRunMode:
         mock_applier.async_apply.assert_not_called()
 
         # Should emit dry_run_executed event instead
-        mock_event_emitter.emit_dry_run_executed.assert_called()
+        mock_event_emitter.emit_dry_run_executed_batch.assert_called()
 
 
 class TestEdgeCases:
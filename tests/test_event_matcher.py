@@ -0,0 +1,103 @@
+"""Unit tests for event_matcher.py"""
+import pytest
+from custom_components.climate_control_calendar.event_matcher import (
+    CompiledBindingMatcher,
+    EventMatcher,
+    matches_calendar,
+)
+
+
+BINDINGS = [
+    {"id": "exact", "match": {"type": "summary", "value": "Mattino"}},
+    {"id": "contains", "match": {"type": "summary_contains", "value": "COMFORT"}},
+    {"id": "regex", "match": {"type": "regex", "value": "^Work.*"}},
+]
+
+
+class TestEventMatcher:
+    """Test single match config evaluation."""
+
+    @pytest.mark.parametrize(
+        "match_config,summary,expected",
+        [
+            ({"type": "summary", "value": "Mattino"}, "Mattino", True),
+            ({"type": "summary", "value": "Mattino"}, "mattino", False),
+            ({"type": "summary_contains", "value": "comfort"}, "High Comfort mode", True),
+            # Lowercasing "İ" yields two characters, longer than the summary
+            ({"type": "summary_contains", "value": "i\u0307"}, "\u0130", True),
+            ({"type": "regex", "value": "^Work.*"}, "Working from home", True),
+            ({"type": "regex", "value": "^Work.*"}, "Home work", False),
+            ({"type": "regex", "value": "Work"}, "Working", True),
+            ({"type": "regex", "value": "^Work$"}, "Work", True),
+            ({"type": "regex", "value": "Work$"}, "Working", False),
+        ],
+    )
+    def test_matches(self, match_config, summary, expected):
+        """Test each supported match type."""
+        assert EventMatcher.matches(match_config, {"summary": summary}) is expected
+
+    def test_unsupported_type_does_not_match(self):
+        """Test that unknown match types never match."""
+        assert not EventMatcher.matches({"type": "location", "value": "x"}, {"summary": "x"})
+
+    def test_invalid_regex_does_not_match(self):
+        """Test that an invalid regex is reported as no match."""
+        assert not EventMatcher.matches({"type": "regex", "value": "("}, {"summary": "("})
+
+    def test_validate_invalid_regex(self):
+        """Test that validation rejects invalid regex patterns."""
+        valid, error = EventMatcher.validate_match_config({"type": "regex", "value": "("})
+        assert not valid
+        assert "Invalid regex" in error
+
+
+class TestCompiledBindingMatcher:
+    """Test batch matching of an event against compiled bindings."""
+
+    @pytest.mark.parametrize(
+        "summary,expected_ids",
+        [
+            ("Mattino", ["exact"]),
+            ("Working in comfort", ["contains", "regex"]),
+            ("Evening", []),
+        ],
+    )
+    def test_match_event(self, summary, expected_ids):
+        """Test matching returns bindings in definition order."""
+        matcher = CompiledBindingMatcher(BINDINGS)
+        matched = matcher.match_event({"summary": summary})
+        assert [b["id"] for b in matched] == expected_ids
+
+    def test_agrees_with_event_matcher(self):
+        """Test compiled matching agrees with EventMatcher.matches."""
+        matcher = CompiledBindingMatcher(BINDINGS)
+        for summary in ("Mattino", "comfort", "Work", "work", ""):
+            event = {"summary": summary}
+            expected = [b for b in BINDINGS if EventMatcher.matches(b["match"], event)]
+            assert matcher.match_event(event) == expected
+
+    def test_invalid_bindings_skipped(self):
+        """Test that bindings with invalid match configs never match."""
+        matcher = CompiledBindingMatcher([
+            {"id": "bad_regex", "match": {"type": "regex", "value": "("}},
+            {"id": "no_match", "match": {}},
+        ])
+        assert matcher.match_event({"summary": "("}) == []
+
+
+class TestMatchesCalendar:
+    """Test calendar filter matching."""
+
+    def test_wildcard(self):
+        """Test wildcard matches any calendar."""
+        assert matches_calendar("*", "calendar.work")
+
+    def test_single_string(self):
+        """Test a single calendar ID given as a string."""
+        assert matches_calendar("calendar.work", "calendar.work")
+        assert not matches_calendar("calendar.work", "calendar.home")
+
+    def test_list(self):
+        """Test a list of calendar IDs."""
+        assert matches_calendar(["calendar.work", "calendar.home"], "calendar.home")
+        assert not matches_calendar(["calendar.work"], "calendar.vacation")
@@ -0,0 +1,66 @@
+"""Unit tests for http_api.py"""
+import json
+
+import pytest
+from unittest.mock import Mock
+from homeassistant.helpers.http import KEY_HASS
+from custom_components.climate_control_calendar.binding_manager import BindingManager
+from custom_components.climate_control_calendar.const import (
+    CONF_BINDINGS,
+    DATA_CONFIG,
+    DOMAIN,
+)
+from custom_components.climate_control_calendar.http_api import ClimateControlConfigView
+
+
+ENTRY_ID = "test_entry"
+
+
+@pytest.fixture
+def bindings():
+    """Bindings list shared by entry options, config data and the manager."""
+    return []
+
+
+@pytest.fixture
+def mock_hass(bindings):
+    """Create a mock Home Assistant instance with one loaded entry."""
+    hass = Mock()
+    entry = Mock()
+    entry.options = {CONF_BINDINGS: bindings}
+    hass.config_entries.async_get_entry = Mock(return_value=entry)
+    hass.data = {DOMAIN: {ENTRY_ID: {DATA_CONFIG: {CONF_BINDINGS: bindings}}}}
+    return hass
+
+
+@pytest.fixture
+async def binding_manager(mock_hass, bindings):
+    """Create a BindingManager sharing the entry's bindings list."""
+    manager = BindingManager(hass=mock_hass, entry_id=ENTRY_ID)
+    await manager.async_load(bindings)
+    return manager
+
+
+async def get_config(hass) -> dict:
+    """Call GET /config and decode the response body."""
+    request = Mock()
+    request.app = {KEY_HASS: hass}
+    response = await ClimateControlConfigView().get(request)
+    return json.loads(response.body)
+
+
+class TestConfigView:
+    """Test the cached config response."""
+
+    async def test_add_binding_visible_in_get(self, mock_hass, binding_manager):
+        """Test that a binding added after a GET shows up in the next GET."""
+        assert (await get_config(mock_hass))["bindings"] == []
+
+        binding_id = await binding_manager.async_add_binding(
+            calendars="*",
+            match_config={"type": "summary", "value": "Mattino"},
+            slot_id="slot1",
+        )
+
+        config = await get_config(mock_hass)
+        assert [b["id"] for b in config["bindings"]] == [binding_id]
@@ -0,0 +1,58 @@
+"""Unit tests for __init__.py"""
+import logging
+
+import pytest
+from unittest.mock import Mock
+from custom_components.climate_control_calendar import (
+    async_disable_debug_logging,
+    async_enable_debug_logging,
+)
+
+
+@pytest.fixture
+def mock_hass():
+    """Create a mock Home Assistant instance."""
+    hass = Mock()
+    hass.data = {}
+    return hass
+
+
+@pytest.fixture
+def integration_logger():
+    """Return the integration logger, restoring its level afterwards."""
+    logger = logging.getLogger("custom_components.climate_control_calendar")
+    original_level = logger.level
+    logger.setLevel(logging.WARNING)
+    yield logger
+    logger.setLevel(original_level)
+
+
+class TestDebugLogging:
+    """Test debug logging shared by several debug-mode entries."""
+
+    def test_two_entries(self, mock_hass, integration_logger):
+        """Test DEBUG stays on until the last debug entry unloads."""
+        async_enable_debug_logging(mock_hass, "entry_1")
+        async_enable_debug_logging(mock_hass, "entry_2")
+        assert integration_logger.level == logging.DEBUG
+
+        async_disable_debug_logging(mock_hass, "entry_1")
+        assert integration_logger.level == logging.DEBUG
+
+        async_disable_debug_logging(mock_hass, "entry_2")
+        assert integration_logger.level == logging.WARNING
+
+    def test_unload_in_reverse_order(self, mock_hass, integration_logger):
+        """Test the original level is restored whichever entry unloads last."""
+        async_enable_debug_logging(mock_hass, "entry_1")
+        async_enable_debug_logging(mock_hass, "entry_2")
+
+        async_disable_debug_logging(mock_hass, "entry_2")
+        async_disable_debug_logging(mock_hass, "entry_1")
+        assert integration_logger.level == logging.WARNING
+
+        # Setting up again after everything unloaded raises the level again
+        async_enable_debug_logging(mock_hass, "entry_1")
+        assert integration_logger.level == logging.DEBUG
+        async_disable_debug_logging(mock_hass, "entry_1")
+        assert integration_logger.level == logging.WARNING